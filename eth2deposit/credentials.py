@@ -2,16 +2,29 @@ import os
 import click
 import time
 import json
-from typing import Dict, List, Optional
-from py_ecc.bls import G2ProofOfPossession as bls
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
+try:
+    from functools import cached_property
+except ImportError:  # Python 3.7
+    from cached_property import cached_property  # type: ignore
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from eth2deposit.exceptions import ValidationError
-from eth2deposit.key_handling.key_derivation.path import mnemonic_and_path_to_key
+from eth2deposit.key_handling.key_derivation.path import (
+    clear_seed_cache,
+    mnemonic_and_indices_to_key,
+)
 from eth2deposit.key_handling.keystore import (
     Keystore,
     ScryptKeystore,
 )
 from eth2deposit.settings import DEPOSIT_CLI_VERSION
+from eth2deposit.utils import bls_backend as bls
 from eth2deposit.utils.constants import (
     BLS_WITHDRAWAL_PREFIX,
     ETH2GWEI,
@@ -33,45 +46,65 @@ class Credential:
     Once created, it is the only object that should be required to perform any processing for a validator.
     """
     def __init__(self, *, mnemonic: str, mnemonic_password: str, index: int, amount: int, fork_version: bytes):
+        # Validate the amount up front, before any key derivation is wasted on it
+        if not MIN_DEPOSIT_AMOUNT <= amount <= MAX_DEPOSIT_AMOUNT:
+            raise ValidationError(f"{amount / ETH2GWEI} ETH deposits are not within the bounds of this cli.")
         # Set path as EIP-2334 format
         # https://eips.ethereum.org/EIPS/eip-2334
-        purpose = '12381'
-        coin_type = '3600'
-        account = str(index)
-        withdrawal_key_path = f'm/{purpose}/{coin_type}/{account}/0'
+        purpose = 12381
+        coin_type = 3600
+        withdrawal_key_indices = (purpose, coin_type, index, 0)
+        withdrawal_key_path = f'm/{purpose}/{coin_type}/{index}/0'
         self.signing_key_path = f'{withdrawal_key_path}/0'
 
-        self.withdrawal_sk = mnemonic_and_path_to_key(
-            mnemonic=mnemonic, path=withdrawal_key_path, password=mnemonic_password)
-        self.signing_sk = mnemonic_and_path_to_key(
-            mnemonic=mnemonic, path=self.signing_key_path, password=mnemonic_password)
+        # Both keys are derived eagerly so the work happens inside the
+        # from_mnemonic worker processes rather than in later serial loops.
+        self.withdrawal_sk = mnemonic_and_indices_to_key(
+            mnemonic=mnemonic, indices=withdrawal_key_indices, password=mnemonic_password)
+        self.signing_sk = mnemonic_and_indices_to_key(
+            mnemonic=mnemonic, indices=withdrawal_key_indices + (0,), password=mnemonic_password)
+        # Fixed 32-byte big-endian form, converted once instead of per use
+        self.signing_sk_bytes = self.signing_sk.to_bytes(32, 'big')
         self.amount = amount
         self.fork_version = fork_version
 
-    @property
+    # A Credential is immutable after __init__, so the derived values below are
+    # cached: each bls.SkToPk (a G1 scalar multiplication) runs at most once.
+    @cached_property
     def signing_pk(self) -> bytes:
         return bls.SkToPk(self.signing_sk)
 
-    @property
+    @cached_property
     def withdrawal_pk(self) -> bytes:
         return bls.SkToPk(self.withdrawal_sk)
 
-    @property
+    @cached_property
     def withdrawal_credentials(self) -> bytes:
         withdrawal_credentials = BLS_WITHDRAWAL_PREFIX
         withdrawal_credentials += SHA256(self.withdrawal_pk)[1:]
         return withdrawal_credentials
 
-    @property
+    @cached_property
     def deposit_message(self) -> DepositMessage:
-        if not MIN_DEPOSIT_AMOUNT <= self.amount <= MAX_DEPOSIT_AMOUNT:
-            raise ValidationError(f"{self.amount / ETH2GWEI} ETH deposits are not within the bounds of this cli.")
+        # The amount bounds are validated once in __init__
         return DepositMessage(
             pubkey=self.signing_pk,
             withdrawal_credentials=self.withdrawal_credentials,
             amount=self.amount,
         )
 
+    @cached_property
+    def deposit_message_root(self) -> bytes:
+        return self.deposit_message.hash_tree_root
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The cached SSZ deposit message accumulates an unpicklable C-level
+        # LRU cache once merkleized; drop it when shipping a Credential to a
+        # worker process (it is rebuilt on demand from the other fields).
+        state = self.__dict__.copy()
+        state.pop('deposit_message', None)
+        return state
+
     def generate_signed_deposit(self, assigned_withdrawal_credentials: Optional[bytes]=None) -> DepositData:
         domain = compute_deposit_domain(fork_version=self.fork_version)
         deposit_message = self.deposit_message
@@ -86,33 +119,123 @@ class Credential:
         )
         return signed_deposit
 
-    def generate_deposit_datum_dict(self, assigned_withdrawal_credentials: Optional[bytes]=None) -> Dict[str, bytes]:
+    def generate_deposit_datum_dict(self, assigned_withdrawal_credentials: Optional[bytes]=None) -> Dict[str, Any]:
         """
         Return a single deposit datum for 1 validator including all
         the information needed to verify and process the deposit.
+        bytes fields are hex-encoded here, so JSON serialization sees only
+        str/int values and never falls back to a per-value Python callback.
         """
         signed_deposit_datum = self.generate_signed_deposit(assigned_withdrawal_credentials)
-        datum_dict = signed_deposit_datum.as_dict()
-        datum_dict.update({'deposit_message_root': self.deposit_message.hash_tree_root})
-        datum_dict.update({'deposit_data_root': signed_deposit_datum.hash_tree_root})
-        datum_dict.update({'fork_version': self.fork_version})
+        datum_dict = {key: value.hex() if isinstance(value, bytes) else value
+                      for key, value in signed_deposit_datum.as_dict().items()}
+        datum_dict.update({'deposit_message_root': self.deposit_message_root.hex()})
+        datum_dict.update({'deposit_data_root': signed_deposit_datum.hash_tree_root.hex()})
+        datum_dict.update({'fork_version': self.fork_version.hex()})
         datum_dict.update({'deposit_cli_version': DEPOSIT_CLI_VERSION})
         return datum_dict
 
-    def signing_keystore(self, password: str) -> Keystore:
-        secret = self.signing_sk.to_bytes(32, 'big')
-        return ScryptKeystore.encrypt(secret=secret, password=password, path=self.signing_key_path)
+    def signing_keystore(self, password: str,
+                         kdf_salt: Optional[bytes]=None, aes_iv: Optional[bytes]=None) -> Keystore:
+        return ScryptKeystore.encrypt(secret=self.signing_sk_bytes, password=password, path=self.signing_key_path,
+                                      kdf_salt=kdf_salt, aes_iv=aes_iv)
 
-    def save_signing_keystore(self, password: str, folder: str) -> str:
-        keystore = self.signing_keystore(password)
-        filefolder = os.path.join(folder, 'keystore-%s-%i.json' % (keystore.path.replace('/', '_'), time.time()))
+    def save_signing_keystore(self, password: str, folder: str,
+                              kdf_salt: Optional[bytes]=None, aes_iv: Optional[bytes]=None,
+                              timestamp: Optional[int]=None) -> str:
+        keystore = self.signing_keystore(password, kdf_salt=kdf_salt, aes_iv=aes_iv)
+        if timestamp is None:
+            timestamp = int(time.time())
+        sanitized_path = keystore.path.replace('/', '_')
+        filefolder = os.path.join(folder, f'keystore-{sanitized_path}-{timestamp}.json')
         keystore.save(filefolder)
         return filefolder
 
     def verify_keystore(self, keystore_filefolder: str, password: str) -> bool:
         saved_keystore = Keystore.from_file(keystore_filefolder)
         secret_bytes = saved_keystore.decrypt(password)
-        return self.signing_sk == int.from_bytes(secret_bytes, 'big')
+        return self.signing_sk_bytes == secret_bytes
+
+
+def _build_credential(args: Tuple[str, str, int, int, bytes]) -> Credential:
+    """
+    Construct a single Credential from an argument tuple.
+    Module-level (and hence picklable) so it can be dispatched to worker processes.
+    """
+    mnemonic, mnemonic_password, index, amount, fork_version = args
+    return Credential(mnemonic=mnemonic, mnemonic_password=mnemonic_password,
+                      index=index, amount=amount, fork_version=fork_version)
+
+
+def _save_keystore(args: Tuple[Credential, str, str, bytes, bytes, int]) -> str:
+    """
+    Encrypt and save the signing keystore for one Credential.
+    Module-level (and hence picklable) so it can be dispatched to worker processes.
+    """
+    credential, password, folder, kdf_salt, aes_iv, timestamp = args
+    return credential.save_signing_keystore(password=password, folder=folder,
+                                            kdf_salt=kdf_salt, aes_iv=aes_iv, timestamp=timestamp)
+
+
+def _in_progress(bar: Any, iterable: Iterable[Any], total: int) -> Iterator[Any]:
+    """
+    Yield from `iterable`, advancing the click progressbar `bar` in batches of
+    roughly 0.5% of `total`, so that very large runs are not dominated by
+    terminal redraws and ETA recomputation.
+    """
+    step = max(1, total // 200)
+    pending = 0
+    for item in iterable:
+        yield item
+        pending += 1
+        if pending == step:
+            bar.update(pending)
+            pending = 0
+    if pending:
+        bar.update(pending)
+
+
+def _serialize_deposit_datum(datum: Dict[str, Any]) -> bytes:
+    """
+    Serialize a single deposit datum to JSON bytes, via orjson when available.
+    """
+    if orjson is not None:
+        # orjson serializes in C and is significantly faster on the
+        # megabytes of hex fields produced by large batches.
+        return orjson.dumps(datum, default=lambda x: x.hex())
+    return json.dumps(datum, default=lambda x: x.hex()).encode('utf-8')
+
+
+def _generate_deposit_datum(args: Tuple[Credential, Optional[bytes]]) -> bytes:
+    """
+    Generate and serialize the deposit datum for one Credential.
+    Module-level (and hence picklable) so it can be dispatched to worker processes.
+    """
+    credential, assigned_withdrawal_credentials = args
+    return _serialize_deposit_datum(credential.generate_deposit_datum_dict(assigned_withdrawal_credentials))
+
+
+def _verify_keystore(args: Tuple[Credential, str, str]) -> bool:
+    """
+    Decrypt one saved keystore and check it against its Credential.
+    Module-level (and hence picklable) so it can be dispatched to worker processes.
+    """
+    credential, filefolder, password = args
+    return credential.verify_keystore(keystore_filefolder=filefolder, password=password)
+
+
+def _keystore_worker_count() -> int:
+    """
+    Return the number of workers to use for keystore encryption.
+    Each scrypt call at EIP-2335 defaults (n=2**18, r=8) allocates ~128 MiB, so
+    cap the pool to what available memory can hold without swapping.
+    """
+    num_workers = os.cpu_count() or 1
+    try:
+        available_ram = os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, OSError, ValueError):
+        return num_workers
+    return max(1, min(num_workers, available_ram // (2 * 128 * 1024 * 1024)))
 
 
 class CredentialList:
@@ -136,28 +259,79 @@ class CredentialList:
                 f"The number of keys ({num_keys}) doesn't equal to the corresponding deposit amounts ({len(amounts)})."
             )
         key_indices = range(start_index, start_index + num_keys)
-        with click.progressbar(key_indices, label='Creating your keys:\t\t',
-                               show_percent=False, show_pos=True) as indices:
-            return cls([Credential(mnemonic=mnemonic, mnemonic_password=mnemonic_password,
-                                   index=index, amount=amounts[index - start_index], fork_version=fork_version)
-                        for index in indices])
+        credential_args = [(mnemonic, mnemonic_password, index, amounts[index - start_index], fork_version)
+                           for index in key_indices]
+        # Key derivation is pure CPU work and independent per index,
+        # so fan it out over all available cores.
+        num_workers = os.cpu_count() or 1
+        try:
+            with click.progressbar(length=num_keys, label='Creating your keys:\t\t',
+                                   show_percent=False, show_pos=True) as bar:
+                with ProcessPoolExecutor(max_workers=num_workers) as executor:
+                    credentials = list(_in_progress(
+                        bar,
+                        executor.map(_build_credential, credential_args,
+                                     chunksize=max(1, num_keys // (4 * num_workers))),
+                        num_keys,
+                    ))
+        finally:
+            # The workers' caches die with the pool; clear this process's copy
+            # too so the mnemonic and seed do not outlive the derivation.
+            clear_seed_cache()
+        return cls(credentials)
 
     def export_keystores(self, password: str, folder: str) -> List[str]:
-        with click.progressbar(self.credentials, label='Creating your keystores:\t',
-                               show_percent=False, show_pos=True) as credentials:
-            return [credential.save_signing_keystore(password=password, folder=folder) for credential in credentials]
+        # One urandom read supplies the scrypt salt (32 bytes) and AES IV
+        # (16 bytes) of every keystore, instead of two CSPRNG calls per key.
+        randomness = os.urandom(48 * len(self.credentials))
+        # Capture the timestamp once so every keystore of a batch shares it,
+        # rather than re-reading the clock (and racing it) per file.
+        batch_timestamp = int(time.time())
+        keystore_args = [(credential, password, folder,
+                          randomness[48 * i: 48 * i + 32], randomness[48 * i + 32: 48 * i + 48],
+                          batch_timestamp)
+                         for i, credential in enumerate(self.credentials)]
+        # scrypt is memory-hard and fully saturates one core per call,
+        # so encrypt the keystores in parallel worker processes.
+        with click.progressbar(length=len(self.credentials), label='Creating your keystores:\t',
+                               show_percent=False, show_pos=True) as bar:
+            with ProcessPoolExecutor(max_workers=_keystore_worker_count()) as executor:
+                filefolders = list(_in_progress(
+                    bar, executor.map(_save_keystore, keystore_args), len(self.credentials)))
+        return filefolders
 
     def export_deposit_data_json(self, folder: str, assigned_withdrawal_credentials: Optional[bytes]=None) -> str:
-        with click.progressbar(self.credentials, label='Creating your depositdata:\t',
-                               show_percent=False, show_pos=True) as credentials:
-            deposit_data = [cred.generate_deposit_datum_dict(assigned_withdrawal_credentials) for cred in credentials]
-        filefolder = os.path.join(folder, 'deposit_data-%i.json' % time.time())
-        with open(filefolder, 'w') as f:
-            json.dump(deposit_data, f, default=lambda x: x.hex())
+        filefolder = os.path.join(folder, f'deposit_data-{int(time.time())}.json')
+        datum_args = [(credential, assigned_withdrawal_credentials) for credential in self.credentials]
+        # Each datum pays a BLS signature (a G2 scalar multiplication plus
+        # hash-to-curve), so generate them in parallel worker processes and
+        # stream the ordered results straight to disk, keeping peak memory
+        # flat regardless of the batch size.
+        num_workers = os.cpu_count() or 1
+        with open(filefolder, 'wb') as f, \
+                click.progressbar(length=len(self.credentials), label='Creating your depositdata:\t',
+                                  show_percent=False, show_pos=True) as bar:
+            f.write(b'[')
+            with ProcessPoolExecutor(max_workers=num_workers) as executor:
+                serialized_data = executor.map(
+                    _generate_deposit_datum, datum_args,
+                    chunksize=max(1, len(self.credentials) // (4 * num_workers)))
+                for i, serialized_datum in enumerate(
+                        _in_progress(bar, serialized_data, len(self.credentials))):
+                    if i != 0:
+                        f.write(b', ')
+                    f.write(serialized_datum)
+            f.write(b']')
         return filefolder
 
     def verify_keystores(self, keystore_filefolders: List[str], password: str) -> bool:
-        with click.progressbar(zip(self.credentials, keystore_filefolders), label='Verifying your keystores:\t',
-                               length=len(self.credentials), show_percent=False, show_pos=True) as items:
-            return all(credential.verify_keystore(keystore_filefolder=filefolder, password=password)
-                       for credential, filefolder in items)
+        verify_args = [(credential, filefolder, password)
+                       for credential, filefolder in zip(self.credentials, keystore_filefolders)]
+        # Each verification pays a full scrypt decryption, so spread the work
+        # over the same memory-capped pool as the encryption path.
+        with click.progressbar(length=len(self.credentials), label='Verifying your keystores:\t',
+                               show_percent=False, show_pos=True) as bar:
+            with ProcessPoolExecutor(max_workers=_keystore_worker_count()) as executor:
+                results = list(_in_progress(
+                    bar, executor.map(_verify_keystore, verify_args), len(self.credentials)))
+        return all(results)
@@ -1,3 +1,4 @@
+import multiprocessing
 import sys
 import click
 
@@ -24,5 +25,9 @@ cli.add_command(new_mnemonic)
 
 
 if __name__ == '__main__':
+    # Must come first: in frozen (PyInstaller) binaries the spawn start method
+    # re-executes this binary for every worker process, and without this the
+    # re-executed child falls into the CLI instead of the worker bootstrap.
+    multiprocessing.freeze_support()
     check_python_version()
     cli()
@@ -1,4 +1,5 @@
-from typing import List
+from functools import lru_cache
+from typing import List, Sequence
 
 from .mnemonic import get_seed
 from .tree import (
@@ -7,6 +8,23 @@ from .tree import (
 )
 
 
+@lru_cache(maxsize=1)
+def _get_cached_seed(mnemonic: str, password: str) -> bytes:
+    """
+    Memoized `get_seed`: one run derives every path from the same mnemonic,
+    so the PBKDF2 seed stretch only needs to happen once per process.
+    """
+    return get_seed(mnemonic=mnemonic, password=password)
+
+
+def clear_seed_cache() -> None:
+    """
+    Drop the memoized seed so the mnemonic and the bytes stretched from it do
+    not stay resident for the rest of the process lifetime.
+    """
+    _get_cached_seed.cache_clear()
+
+
 def path_to_nodes(path: str) -> List[int]:
     """
     Maps from a path string to a list of indices where each index represents the corresponding level in the path.
@@ -24,13 +42,21 @@ def path_to_nodes(path: str) -> List[int]:
     return [int(index) for index in indices]
 
 
+def mnemonic_and_indices_to_key(*, mnemonic: str, indices: Sequence[int], password: str) -> int:
+    """
+    Return the SK at the EIP-2334 position given by `indices` (the path levels
+    below `m`), derived from `mnemonic`, skipping the string path parse.
+    """
+    seed = _get_cached_seed(mnemonic, password)
+    sk = derive_master_SK(seed)
+    for index in indices:
+        sk = derive_child_SK(parent_SK=sk, index=index)
+    return sk
+
+
 def mnemonic_and_path_to_key(*, mnemonic: str, path: str, password: str) -> int:
     """
     Return the SK at position `path`, derived from `mnemonic`. The password is to be
     compliant with BIP39 mnemonics that use passwords, but is not used by this CLI outside of tests.
     """
-    seed = get_seed(mnemonic=mnemonic, password=password)
-    sk = derive_master_SK(seed)
-    for node in path_to_nodes(path):
-        sk = derive_child_SK(parent_SK=sk, index=node)
-    return sk
+    return mnemonic_and_indices_to_key(mnemonic=mnemonic, indices=path_to_nodes(path), password=password)
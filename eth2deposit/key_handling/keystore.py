@@ -6,8 +6,8 @@ from dataclasses import (
 )
 import json
 from py_ecc.bls import G2ProofOfPossession as bls
-from secrets import randbits
-from typing import Any, Dict, Union
+from secrets import token_bytes
+from typing import Any, Dict, Optional, Union
 from unicodedata import normalize
 from uuid import uuid4
 
@@ -124,19 +124,23 @@ class Keystore(BytesDataclass):
 
     @classmethod
     def encrypt(cls, *, secret: bytes, password: str, path: str='',
-                kdf_salt: bytes=randbits(256).to_bytes(32, 'big'),
-                aes_iv: bytes=randbits(128).to_bytes(16, 'big')) -> 'Keystore':
+                kdf_salt: Optional[bytes]=None,
+                aes_iv: Optional[bytes]=None) -> 'Keystore':
         """
         Encrypt a secret (BLS SK) as an EIP 2335 Keystore.
+
+        When `kdf_salt` or `aes_iv` are not supplied, fresh randomness is drawn
+        for each call. (They were previously default arguments, evaluated once
+        at import, which silently reused the same salt and IV per process.)
         """
         keystore = cls()
         keystore.uuid = str(uuid4())
-        keystore.crypto.kdf.params['salt'] = kdf_salt
+        keystore.crypto.kdf.params['salt'] = token_bytes(32) if kdf_salt is None else kdf_salt
         decryption_key = keystore.kdf(
             password=cls._process_password(password),
             **keystore.crypto.kdf.params
         )
-        keystore.crypto.cipher.params['iv'] = aes_iv
+        keystore.crypto.cipher.params['iv'] = token_bytes(16) if aes_iv is None else aes_iv
         cipher = AES_128_CTR(key=decryption_key[:16], **keystore.crypto.cipher.params)
         keystore.crypto.cipher.message = cipher.encrypt(secret)
         keystore.crypto.checksum.message = SHA256(decryption_key[16:32] + keystore.crypto.cipher.message)
@@ -0,0 +1,44 @@
+"""
+BLS12-381 signing backend.
+
+Dispatches to the `blst` bindings (SWIG bindings for supranational's C
+library with assembly-optimized field arithmetic) when they are installed,
+and falls back to the pure-Python `py_ecc` implementation otherwise.
+Both produce identical signatures for the eth2 G2 proof-of-possession
+scheme, blst just does so orders of magnitude faster.
+"""
+from py_ecc.bls import G2ProofOfPossession as _py_ecc_bls
+
+from eth2deposit.utils import bls_fixed_base
+
+try:
+    import blst
+except ImportError:
+    blst = None
+
+# Domain separation tag of the eth2 G2 proof-of-possession scheme
+DST = b'BLS_SIG_BLS12381G2_XMD:SHA-256_SSWU_RO_POP_'
+
+
+def SkToPk(sk: int) -> bytes:
+    """
+    Return the compressed G1 public key for the secret key `sk`.
+    """
+    if blst is not None:
+        secret_key = blst.SecretKey()
+        secret_key.from_bendian(sk.to_bytes(32, 'big'))
+        return bytes(blst.P1(secret_key).compress())
+    # blst multiplies its precomputed generator in C; give the py_ecc path
+    # the equivalent fixed-base comb table.
+    return bls_fixed_base.sk_to_pk(sk)
+
+
+def Sign(sk: int, message: bytes) -> bytes:
+    """
+    Return the compressed G2 signature of `message` under the secret key `sk`.
+    """
+    if blst is not None:
+        secret_key = blst.SecretKey()
+        secret_key.from_bendian(sk.to_bytes(32, 'big'))
+        return bytes(blst.P2().hash_to(message, DST).sign_with(secret_key).compress())
+    return _py_ecc_bls.Sign(sk, message)
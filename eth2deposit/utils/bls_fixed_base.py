@@ -0,0 +1,57 @@
+"""
+Fixed-base comb precomputation for BLS public-key derivation.
+
+Every SkToPk call multiplies the same G1 generator by a scalar, and py_ecc
+redoes the full double-and-add ladder each time. Precomputing
+`j * 2**(4i) * G1` for every 4-bit scalar window turns each derivation into
+at most 64 point additions with no doublings. The table is built lazily on
+first use, so importing this module stays free for runs that never hit the
+py_ecc fallback.
+"""
+from typing import Any, List, Optional
+
+from py_ecc.bls.g2_primatives import G1_to_pubkey
+from py_ecc.optimized_bls12_381 import (
+    G1,
+    Z1,
+    add,
+    double,
+)
+
+WINDOW_BITS = 4
+NUM_WINDOWS = 256 // WINDOW_BITS
+WINDOW_MASK = 2 ** WINDOW_BITS - 1
+
+_table: Optional[List[List[Any]]] = None
+
+
+def _build_table() -> List[List[Any]]:
+    """
+    Return the comb table T with T[i][j] = j * 2**(WINDOW_BITS * i) * G1.
+    """
+    table = []
+    base = G1
+    for _ in range(NUM_WINDOWS):
+        row = [Z1]
+        for _ in range(WINDOW_MASK):
+            row.append(add(row[-1], base))
+        table.append(row)
+        for _ in range(WINDOW_BITS):
+            base = double(base)
+    return table
+
+
+def sk_to_pk(sk: int) -> bytes:
+    """
+    Return the compressed G1 public key for `sk`, summing precomputed
+    window points instead of running a fresh double-and-add ladder.
+    """
+    global _table
+    if _table is None:
+        _table = _build_table()
+    accumulator = Z1
+    for i in range(NUM_WINDOWS):
+        window = (sk >> (WINDOW_BITS * i)) & WINDOW_MASK
+        if window:
+            accumulator = add(accumulator, _table[i][window])
+    return G1_to_pubkey(accumulator)
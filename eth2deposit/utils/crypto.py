@@ -1,4 +1,10 @@
-from typing import Any
+from hashlib import sha256 as _hashlib_sha256
+from typing import Any, Union
+
+try:
+    from hashlib import scrypt as _hashlib_scrypt  # Requires OpenSSL 1.1+
+except ImportError:
+    _hashlib_scrypt = None
 
 from Crypto.Hash import (
     SHA256 as _sha256,
@@ -15,16 +21,25 @@ from Crypto.Cipher import (
 
 
 def SHA256(x: bytes) -> bytes:
-    return _sha256.new(x).digest()
+    # hashlib dispatches to OpenSSL, which uses the SHA-NI instructions
+    # where the CPU supports them.
+    return _hashlib_sha256(x).digest()
 
 
-def scrypt(*, password: str, salt: str, n: int, r: int, p: int, dklen: int) -> bytes:
+def scrypt(*, password: Union[str, bytes], salt: Union[str, bytes], n: int, r: int, p: int, dklen: int) -> bytes:
     if n * r * p < 2**20:  # 128 MB memory usage
         raise ValueError("The Scrypt parameters chosen are not secure.")
     if n >= 2**(128 * r / 8):
         raise ValueError("The given `n` should be less than `2**(128 * r / 8)`."
                          f"\tGot `n={n}`, r={r}, 2**(128 * r / 8)={2**(128 * r / 8)}")
-    res = _scrypt(password=password, salt=salt, key_len=dklen, N=n, r=r, p=p)
+    password = password.encode('utf-8') if isinstance(password, str) else password
+    salt = salt.encode('utf-8') if isinstance(salt, str) else salt
+    if _hashlib_scrypt is not None:
+        # Dispatch to OpenSSL's C scrypt when available; it is several times
+        # faster than interpreted fallbacks. `maxmem` must cover the
+        # 128 * n * r byte working set (the default of 32 MiB raises at n=2**18).
+        return _hashlib_scrypt(password=password, salt=salt, n=n, r=r, p=p, dklen=dklen, maxmem=2**31 - 1)
+    res = _scrypt(password=password, salt=salt, key_len=dklen, N=n, r=r, p=p)  # type: ignore
     return res if isinstance(res, bytes) else res[0]  # PyCryptodome can return Tuple[bytes]
 
 
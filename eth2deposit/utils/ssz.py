@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from ssz import (
     ByteVector,
     Serializable,
@@ -31,9 +33,13 @@ class ForkData(Serializable):
     ]
 
 
+@lru_cache(maxsize=None)
 def compute_deposit_domain(fork_version: bytes) -> bytes:
     """
     Deposit-only `compute_domain`
+
+    Memoized: a run only ever signs for one fork version, so the ForkData
+    merkleization is not repeated per validator.
     """
     if len(fork_version) != 4:
         raise ValueError(f"Fork version should be in 4 bytes. Got {len(fork_version)}.")
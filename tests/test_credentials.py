@@ -12,7 +12,7 @@ def credential():
         mnemonic="legal winner thank year wave sausage worth useful legal winner thank yellow",
         mnemonic_password="12345678",
         index=0,
-        amount=32,
+        amount=32 * 10 ** 9,
         fork_version=bytes.fromhex('00000000'),
     )
 
@@ -59,6 +59,30 @@ def test_encrypt_decrypt_scrypt_random_iv() -> None:
     assert generated_keystore.decrypt(test_vector_password) == test_vector_secret
 
 
+def test_encrypt_fresh_randomness_per_call() -> None:
+    # Salt and IV must be captured immediately: the dataclass default crypto
+    # modules are shared between instances, so a later encrypt overwrites them.
+    keystore_1 = ScryptKeystore.encrypt(secret=test_vector_secret, password=test_vector_password)
+    salt_1 = keystore_1.crypto.kdf.params['salt']
+    iv_1 = keystore_1.crypto.cipher.params['iv']
+    keystore_2 = ScryptKeystore.encrypt(secret=test_vector_secret, password=test_vector_password)
+    assert salt_1 != keystore_2.crypto.kdf.params['salt']
+    assert iv_1 != keystore_2.crypto.cipher.params['iv']
+
+
+def test_encrypt_explicit_salt_and_iv() -> None:
+    kdf_salt = b'\x01' * 32
+    aes_iv = b'\x02' * 16
+    generated_keystore = ScryptKeystore.encrypt(
+        secret=test_vector_secret,
+        password=test_vector_password,
+        kdf_salt=kdf_salt,
+        aes_iv=aes_iv)
+    assert generated_keystore.crypto.kdf.params['salt'] == kdf_salt
+    assert generated_keystore.crypto.cipher.params['iv'] == aes_iv
+    assert generated_keystore.decrypt(test_vector_password) == test_vector_secret
+
+
 def test_encrypt_decrypt_incorrect_password() -> None:
     generated_keystore = ScryptKeystore.encrypt(secret=test_vector_secret, password=test_vector_password)
     incorrect_password = test_vector_password + 'incorrect'
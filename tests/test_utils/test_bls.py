@@ -0,0 +1,42 @@
+import random
+
+import pytest
+
+from py_ecc.bls import G2ProofOfPossession as bls
+from py_ecc.optimized_bls12_381 import curve_order
+
+from eth2deposit.utils import bls_backend
+from eth2deposit.utils.bls_fixed_base import sk_to_pk
+
+
+@pytest.mark.parametrize(
+    'sk',
+    [
+        1,
+        2,
+        curve_order // 2,
+        curve_order - 1,
+    ]
+)
+def test_sk_to_pk_edge_cases(sk):
+    assert sk_to_pk(sk) == bls.SkToPk(sk)
+
+
+def test_sk_to_pk_random_scalars():
+    rng = random.Random(1337)
+    for _ in range(8):
+        sk = rng.randrange(1, curve_order)
+        assert sk_to_pk(sk) == bls.SkToPk(sk)
+
+
+def test_backend_sk_to_pk_matches_py_ecc():
+    sk = random.Random(42).randrange(1, curve_order)
+    assert bls_backend.SkToPk(sk) == bls.SkToPk(sk)
+
+
+def test_backend_sign_matches_py_ecc():
+    sk = random.Random(42).randrange(1, curve_order)
+    message = b'\x11' * 32
+    signature = bls_backend.Sign(sk, message)
+    assert signature == bls.Sign(sk, message)
+    assert bls.Verify(bls.SkToPk(sk), message, signature)